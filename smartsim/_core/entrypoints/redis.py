@@ -28,6 +28,7 @@ import argparse
 import json
 import os
 import signal
+import sys
 import textwrap
 import typing as t
 from subprocess import PIPE, STDOUT
@@ -93,9 +94,39 @@ def print_summary(
     )
 
 
-def main(args: argparse.Namespace) -> int:
+def forward_output(fileno: int, chunk_size: int = 1 << 16) -> None:
+    """Copy the database output to stdout until the pipe is closed
+
+    :param fileno: file descriptor of the database output pipe
+    :param chunk_size: maximum number of bytes read at a time
+    """
+    out = sys.stdout.buffer
+    while chunk := os.read(fileno, chunk_size):
+        out.write(chunk)
+        out.flush()
+
+
+def run_and_forward(cmd: t.List[str]) -> int:
+    """Run the database as a child process and forward its output
+
+    :param cmd: command to start the database
+    :return: exit code of the entrypoint
+    """
     global DBPID  # pylint: disable=global-statement
 
+    try:
+        process = psutil.Popen(cmd, stdout=PIPE, stderr=STDOUT)
+        DBPID = process.pid
+
+        forward_output(process.stdout.fileno())
+    except Exception:
+        cleanup()
+        logger.error("Database process starter raised an exception", exc_info=True)
+        return 1
+    return 0
+
+
+def main(args: argparse.Namespace) -> int:
     src_addr, *bind_addrs = (current_ip(net_if) for net_if in args.ifname.split(","))
     shard_data = LaunchedShardData(
         name=args.name, hostname=src_addr, port=args.port, cluster=args.cluster
@@ -113,17 +144,16 @@ def main(args: argparse.Namespace) -> int:
 
     print_summary(cmd, args.ifname, shard_data)
 
-    try:
-        process = psutil.Popen(cmd, stdout=PIPE, stderr=STDOUT)
-        DBPID = process.pid
+    if args.tee:
+        return run_and_forward(cmd)
 
-        for line in iter(process.stdout.readline, b""):
-            print(line.decode("utf-8").rstrip(), flush=True)
-    except Exception:
-        cleanup()
+    # replace this process with the database so that it writes to our
+    # stdout directly and receives any signals sent to the step
+    try:
+        os.execvp(cmd[0], cmd)
+    except OSError:
         logger.error("Database process starter raised an exception", exc_info=True)
-        return 1
-    return 0
+    return 1
 
 
 def cleanup() -> None:
@@ -138,9 +168,13 @@ def cleanup() -> None:
         logger.warning(f"Failed to clean up database gracefully: {str(e)}")
 
 
-if __name__ == "__main__":
-    os.environ["PYTHONUNBUFFERED"] = "1"
+def register_signal_handlers() -> None:
+    """Register a signal handling function for all termination events"""
+    for sig in SIGNALS:
+        signal.signal(sig, handle_signal)
 
+
+def get_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prefix_chars="+", description="SmartSim Process Launcher"
     )
@@ -180,13 +214,21 @@ if __name__ == "__main__":
         action="store_true",
         help="Specify if this orchestrator shard is part of a cluster",
     )
+    parser.add_argument(
+        "+tee",
+        action="store_true",
+        help="Run the orchestrator as a child process and forward its output",
+    )
+    return parser
 
-    args_ = parser.parse_args()
+
+if __name__ == "__main__":
+    os.environ["PYTHONUNBUFFERED"] = "1"
+    args_ = get_parser().parse_args()
 
     # make sure to register the cleanup before the start
     # the process so our signaller will be able to stop
     # the database process.
-    for sig in SIGNALS:
-        signal.signal(sig, handle_signal)
+    register_signal_handlers()
 
     raise SystemExit(main(args_))
@@ -24,9 +24,11 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import copy
 import pathlib
 import shutil
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from distutils import dir_util  # pylint: disable=deprecated-module
 from logging import DEBUG, INFO
@@ -206,6 +208,8 @@ class Generator:
         if not entities:
             return
 
+        # directories are created in order so that name collisions are
+        # raised before any entity is populated
         for entity in entities:
             if entity_list:
                 dst = path.join(self.gen_path, entity_list.name, entity.name)
@@ -224,17 +228,44 @@ class Generator:
             pathlib.Path(dst).mkdir(exist_ok=True)
             entity.path = dst
 
-            self._copy_entity_files(entity)
-            self._link_entity_files(entity)
-            self._write_tagged_entity_files(entity)
+        # entities are independent, so their files are populated
+        # concurrently and the parameters logged afterwards in order
+        if len(entities) == 1:
+            files_to_params = [self._populate_entity_dir(entities[0])]
+        else:
+            with ThreadPoolExecutor() as executor:
+                files_to_params = list(
+                    executor.map(self._populate_entity_dir, entities)
+                )
+
+        for entity, entity_files_to_params in zip(entities, files_to_params):
+            if entity_files_to_params is not None:
+                self._log_params(entity, entity_files_to_params)
+
+    def _populate_entity_dir(
+        self, entity: Model
+    ) -> t.Optional[t.Dict[str, t.Dict[str, str]]]:
+        """Copy, link and configure the files attached to an entity
 
-    def _write_tagged_entity_files(self, entity: Model) -> None:
+        :param entity: a Model instance with its path set
+        :returns: A dict connecting each tagged file to its parameter settings,
+                  or None if the entity has no attached files
+        """
+        self._copy_entity_files(entity)
+        self._link_entity_files(entity)
+        return self._write_tagged_entity_files(entity)
+
+    def _write_tagged_entity_files(
+        self, entity: Model
+    ) -> t.Optional[t.Dict[str, t.Dict[str, str]]]:
         """Read, configure and write the tagged input files for
            a Model instance within an ensemble. This function
            specifically deals with the tagged files attached to
            an Ensemble.
 
         :param entity: a Model instance
+        :returns: A dict connecting each tagged file to its parameter settings,
+                  or None if the entity has no attached files
         """
         if entity.files:
             to_write = []
@@ -262,12 +293,12 @@ class Generator:
             if entity.files.tagged_hierarchy:
                 _build_tagged_files(entity.files.tagged_hierarchy)
 
-            # write in changes to configurations
+            # write in changes to configurations. The writer holds the
+            # lines of the file being configured, so each entity gets its own
             if isinstance(entity, Model):
-                files_to_params = self._writer.configure_tagged_model_files(
-                    to_write, entity.params
-                )
-                self._log_params(entity, files_to_params)
+                writer = copy.copy(self._writer)
+                return writer.configure_tagged_model_files(to_write, entity.params)
+        return None
 
     def _log_params(
         self, entity: Model, files_to_params: t.Dict[str, t.Dict[str, str]]
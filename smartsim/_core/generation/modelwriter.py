@@ -41,6 +41,8 @@ class ModelWriter:
         self.tag = ";"
         self.regex = "(;[^;]+;)"
         self.lines: t.List[str] = []
+        # text every match of the regex must contain, if known
+        self._required_text: t.Optional[str] = self.tag
 
     def set_tag(self, tag: str, regex: t.Optional[str] = None) -> None:
         """Set the tag for the modelwriter to search for within
@@ -53,9 +55,12 @@ class ModelWriter:
         """
         if regex:
             self.regex = regex
+            self._required_text = None
         else:
             self.tag = tag
             self.regex = "".join(("(", tag, ".+", tag, ")"))
+            # a tag with regex metacharacters does not match itself literally
+            self._required_text = tag if re.escape(tag) == tag else None
 
     def configure_tagged_model_files(
         self,
@@ -74,8 +79,11 @@ class ModelWriter:
         files_to_tags: t.Dict[str, t.Dict[str, str]] = {}
         for tagged_file in tagged_files:
             self._set_lines(tagged_file)
+            original_lines = self.lines
             used_tags = self._replace_tags(params, make_missing_tags_fatal)
-            self._write_changes(tagged_file)
+            # files without any tags are left as they are on disk
+            if self.lines != original_lines:
+                self._write_changes(tagged_file)
             files_to_tags[tagged_file] = used_tags
 
         return files_to_tags
@@ -87,7 +95,7 @@ class ModelWriter:
         :raises ParameterWriterError: if the newly created file cannot be read
         """
         try:
-            with open(file_path, "r+", encoding="utf-8") as file_stream:
+            with open(file_path, "r", encoding="utf-8") as file_stream:
                 self.lines = file_stream.readlines()
         except (IOError, OSError) as e:
             raise ParameterWriterError(file_path) from e
@@ -98,9 +106,8 @@ class ModelWriter:
         :raises ParameterWriterError: if the newly created file cannot be read
         """
         try:
-            with open(file_path, "w+", encoding="utf-8") as file_stream:
-                for line in self.lines:
-                    file_stream.write(line)
+            with open(file_path, "w", encoding="utf-8") as file_stream:
+                file_stream.write("".join(self.lines))
         except (IOError, OSError) as e:
             raise ParameterWriterError(file_path, read=False) from e
 
@@ -115,26 +122,33 @@ class ModelWriter:
             if a tag is not matched
         :returns: A dict of parameter names and values set for the file
         """
-        edited = []
+        edited: t.List[str] = []
         unused_tags: t.DefaultDict[str, t.List[int]] = collections.defaultdict(list)
         used_params: t.Dict[str, str] = {}
-        for i, line in enumerate(self.lines, 1):
-            while search := re.search(self.regex, line):
-                tagged_line = search.group(0)
-                previous_value = self._get_prev_value(tagged_line)
-                if self._is_ensemble_spec(tagged_line, params):
-                    new_val = str(params[previous_value])
-                    line = re.sub(self.regex, new_val, line, 1)
-                    used_params[previous_value] = new_val
-
-                # if a tag is found but is not in this model's configurations
-                # put in placeholder value
-                else:
-                    tag = tagged_line.split(self.tag)[1]
-                    unused_tags[tag].append(i)
-                    line = re.sub(self.regex, previous_value, line)
-                    break
-            edited.append(line)
+
+        def _replace(search: t.Match[str]) -> str:
+            tagged_line = search.group(0)
+            previous_value = self._get_prev_value(tagged_line)
+            if self._is_ensemble_spec(tagged_line, params):
+                new_val = str(params[previous_value])
+                used_params[previous_value] = new_val
+                return new_val
+
+            # if a tag is found but is not in this model's configurations
+            # put in placeholder value
+            unused_tags[previous_value].append(len(edited) + 1)
+            return previous_value
+
+        # substitute every tag on a line in a single pass instead of
+        # rescanning the line after each replacement. Lines that cannot
+        # contain a tag are kept as is without running the regex
+        pattern = re.compile(self.regex)
+        required = self._required_text
+        for line in self.lines:
+            if required is not None and required not in line:
+                edited.append(line)
+            else:
+                edited.append(pattern.sub(_replace, line))
 
         for tag, value in unused_tags.items():
             missing_tag_message = f"Unused tag {tag} on line(s): {str(value)}"
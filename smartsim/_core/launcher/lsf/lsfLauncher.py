@@ -26,6 +26,7 @@
 
 import time
 import typing as t
+from subprocess import DEVNULL
 
 from ....error import LauncherError
 from ....log import get_logger
@@ -109,7 +110,9 @@ class LSFLauncher(WLMLauncher):
                 step_id = parse_bsub(out)
                 logger.debug(f"Gleaned batch job id: {step_id} for {step.name}")
         elif isinstance(step, JsrunStep):
-            self.task_manager.start_task(cmd_list, step.cwd)
+            # jsrun directs the step output itself and this task is never
+            # queried for updates, so there is nothing to capture
+            self.task_manager.start_task(cmd_list, step.cwd, out=DEVNULL, err=DEVNULL)
             time.sleep(1)
             step_id = self._get_lsf_step_id(step)
             logger.debug(f"Gleaned jsrun step id: {step_id} for {step.name}")
@@ -26,10 +26,13 @@
 
 from __future__ import annotations
 
+import os
+import select
+import selectors
 import time
 import typing as t
 from subprocess import PIPE
-from threading import RLock
+from threading import Event, RLock
 
 import psutil
 
@@ -41,7 +44,10 @@ from ..utils.shell import execute_async_cmd, execute_cmd
 logger = get_logger(__name__)
 VERBOSE_TM = check_dev_log_level()  # pylint: disable=invalid-name
 
-TM_INTERVAL = 1
+TM_MIN_INTERVAL = 0.05
+TM_MAX_INTERVAL = 5.0
+TM_READ_SIZE = 1 << 16
+TM_MAX_OUTPUT = 1 << 24
 
 
 class TaskManager:
@@ -49,9 +55,13 @@ class TaskManager:
     the asyncronous shell interface. Each task is a wrapper
     around the Popen/Process instance.
 
-    The Task Managers polls processes on TM_INTERVAL
-    and detects job failure and completion. Upon termination, the
-    task returncode, output, and error are added to the task history.
+    Where the platform supports it, each task is watched through a
+    process file descriptor (pidfd) so the Task Manager blocks until
+    a process exits. Tasks without a pidfd are polled on an interval
+    that starts at TM_MIN_INTERVAL and doubles, up to TM_MAX_INTERVAL,
+    each time a pass completes without any task finishing.
+    Upon termination, the task returncode, output, and error are
+    added to the task history.
 
     When a launcher uses the task manager to start a task, the task
     is either managed (by a WLM) or unmanaged (meaning not managed by
@@ -65,8 +75,11 @@ class TaskManager:
         self.task_history: t.Dict[
             str, t.Tuple[t.Optional[int], t.Optional[str], t.Optional[str]]
         ] = {}
-        self.tasks: t.List[Task] = []
+        self.tasks: t.Dict[str, Task] = {}
         self._lock = RLock()
+        self._selector = selectors.DefaultSelector()
+        self._interval = TM_MIN_INTERVAL
+        self._has_tasks = Event()
 
     def start(self) -> None:
         """Start the task manager thread
@@ -84,21 +97,99 @@ class TaskManager:
             logger.debug("Starting Task Manager")
 
         self.actively_monitoring = True
-        while self.actively_monitoring:
-            time.sleep(TM_INTERVAL)
+        self._interval = TM_MIN_INTERVAL
+
+        # launchers start the monitor before their first task, so wait for
+        # a task to be added rather than finding nothing to monitor
+        self._has_tasks.wait()
 
-            for task in self.tasks:
+        while self.actively_monitoring:
+            finished: t.List[t.Tuple[Task, int]] = []
+            for task in self._wait_for_tasks(self._interval):
                 returncode = task.check_status()  # poll and set returncode
                 # has to be != None because returncode can be 0
                 if returncode is not None:
+                    finished.append((task, returncode))
+
+            # tasks are removed once every status has been checked
+            for task, returncode in finished:
+                with self._lock:
                     output, error = task.get_io()
                     self.add_task_history(task.pid, returncode, output, error)
                     self.remove_task(task.pid)
 
-            if len(self) == 0:
-                self.actively_monitoring = False
-                if VERBOSE_TM:
-                    logger.debug("Sleeping, no tasks to monitor")
+            # back off while tasks are long running
+            if finished:
+                self._interval = TM_MIN_INTERVAL
+            else:
+                self._interval = min(self._interval * 2, TM_MAX_INTERVAL)
+
+            with self._lock:
+                if len(self) == 0:
+                    self.actively_monitoring = False
+                    self._has_tasks.clear()
+                    if VERBOSE_TM:
+                        logger.debug("Sleeping, no tasks to monitor")
+
+    def _wait_for_tasks(self, timeout: float) -> t.List[Task]:
+        """Block until a watched task exits or the timeout expires
+
+        :param timeout: maximum time to wait in seconds
+        :return: tasks whose status should be checked
+        """
+        with self._lock:
+            polled = [task for task in self.tasks.values() if task.pidfd is None]
+            watching = bool(self._selector.get_map())
+
+        if not watching:
+            time.sleep(timeout)
+            return polled
+
+        events = self._selector.select(timeout=timeout)
+
+        ready: t.List[Task] = []
+        with self._lock:
+            watched = self._selector.get_map()
+            for key, _ in events:
+                # the task may have been removed, and its file descriptor
+                # reused by another task, since the event was returned
+                current = watched.get(key.fd)
+                if current is None or current.data is not key.data:
+                    continue
+                task: Task = current.data
+                if key.fd == task.pidfd:
+                    ready.append(task)
+                elif not task.read_pipe(key.fd):
+                    self._selector.unregister(key.fd)
+        return ready + polled
+
+    def _add_task(self, task: Task) -> None:
+        """Track a task and watch its pidfd and output pipes
+
+        :param task: task to track
+        """
+        with self._lock:
+            if task.pidfd is not None:
+                self._selector.register(task.pidfd, selectors.EVENT_READ, task)
+            for fileno in task.pipes:
+                self._selector.register(fileno, selectors.EVENT_READ, task)
+            self.tasks[task.pid] = task
+            self.task_history[task.pid] = (None, None, None)
+            self._interval = TM_MIN_INTERVAL
+            self._has_tasks.set()
+
+    def _discard_task(self, task: Task) -> None:
+        """Stop tracking a task and release its pidfd and output pipes
+
+        :param task: task to stop tracking
+        """
+        with self._lock:
+            watched = self._selector.get_map()
+            for fileno in (task.pidfd, *task.pipes):
+                if fileno is not None and fileno in watched:
+                    self._selector.unregister(fileno)
+            task.close()
+            self.tasks.pop(task.pid, None)
 
     def start_task(
         self,
@@ -116,8 +207,10 @@ class TaskManager:
         :param cmd_list: command to run
         :param cwd: current working directory
         :param env: environment to launch with
-        :param out: output file
-        :param err: error file
+        :param out: output file, PIPE to capture the output in the task history
+        :param err: error file, PIPE to capture the error in the task history.
+                    Only the last TM_MAX_OUTPUT bytes of captured output and
+                    error are kept
         :return: task id
         """
         with self._lock:
@@ -125,8 +218,7 @@ class TaskManager:
             task = Task(proc)
             if VERBOSE_TM:
                 logger.debug(f"Starting Task {task.pid}")
-            self.tasks.append(task)
-            self.task_history[task.pid] = (None, None, None)
+            self._add_task(task)
             return task.pid
 
     @staticmethod
@@ -163,9 +255,7 @@ class TaskManager:
         with self._lock:
             try:
                 process = psutil.Process(pid=task_id)
-                task = Task(process)
-                self.tasks.append(task)
-                self.task_history[task.pid] = (None, None, None)
+                self._add_task(Task(process))
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 msg = f"Process provided {task_id} does not exist"
                 raise LauncherError(msg) from None
@@ -185,7 +275,7 @@ class TaskManager:
                     returncode = task.check_status()
                     out, err = task.get_io()
                     self.add_task_history(task_id, returncode, out, err)
-                self.tasks.remove(task)
+                self._discard_task(task)
             except psutil.NoSuchProcess:
                 logger.debug("Failed to kill a task during removal")
             except KeyError:
@@ -209,7 +299,7 @@ class TaskManager:
                         return task.status, return_code, out, err
                     # removed forcefully either by OS or us, no returncode set
                     # either way, job has completed and we won't have returncode
-                    # Usually hits when jobs last less then the TM_INTERVAL
+                    # Usually hits when jobs last less then the polling interval
                     except (KeyError, psutil.NoSuchProcess):
                         return "Completed", return_code, out, err
 
@@ -244,10 +334,7 @@ class TaskManager:
 
     def __getitem__(self, task_id: str) -> Task:
         with self._lock:
-            for task in self.tasks:
-                if task.pid == task_id:
-                    return task
-            raise KeyError
+            return self.tasks[task_id]
 
     def __len__(self) -> int:
         with self._lock:
@@ -262,6 +349,28 @@ class Task:
         """
         self.process = process
         self.pid = str(self.process.pid)
+        # only processes we own are reaped by check_status, so only
+        # they can be watched without the pidfd staying readable. A process
+        # that was already reaped may have had its pid reused, so it is
+        # left to the poll path, which returns the cached returncode
+        self.pidfd: t.Optional[int] = None
+        if self.owned and self.returncode is None:
+            self.pidfd = _open_pidfd(self.process.pid)
+
+        # output is read from the pipes while the task runs so that the
+        # task never blocks on a full pipe
+        self._streams: t.Dict[int, t.IO[bytes]] = {}
+        self._buffers: t.Dict[int, bytearray] = {}
+        self._io_pipes: t.List[t.Optional[int]] = [None, None]
+        if isinstance(self.process, psutil.Popen):
+            for i, stream in enumerate((self.process.stdout, self.process.stderr)):
+                if stream is not None:
+                    fileno = stream.fileno()
+                    os.set_blocking(fileno, False)
+                    self._streams[fileno] = stream
+                    self._buffers[fileno] = bytearray()
+                    self._io_pipes[i] = fileno
+        self._open_pipes = set(self._streams)
 
     def check_status(self) -> t.Optional[int]:
         """Ping the job and return the returncode if finished
@@ -277,20 +386,74 @@ class Task:
         # have to rely on .kill() to stop.
         return self.returncode
 
+    @property
+    def pipes(self) -> t.List[int]:
+        """File descriptors of the output pipes of the task"""
+        return list(self._streams)
+
+    def read_pipe(self, fileno: int) -> bool:
+        """Read one chunk of the output available on one of the task pipes
+
+        The selector reports the pipe again while more output is waiting,
+        so a task writing continuously is throttled by its pipe rather
+        than read into memory as fast as it can write.
+
+        :param fileno: file descriptor of the pipe
+        :return: False once the pipe has been closed by the task
+        """
+        return self._read_chunk(fileno) != 0
+
+    def _read_chunk(self, fileno: int) -> t.Optional[int]:
+        """Read at most TM_READ_SIZE bytes from a pipe into its buffer
+
+        Only the last TM_MAX_OUTPUT bytes read from the pipe are kept.
+
+        :param fileno: file descriptor of the pipe
+        :return: bytes read, 0 once the pipe is closed, or None if no
+                 output is available
+        """
+        if fileno not in self._open_pipes:
+            return 0
+        try:
+            chunk = os.read(fileno, TM_READ_SIZE)
+        except BlockingIOError:
+            return None
+        if not chunk:
+            self._open_pipes.discard(fileno)
+            return 0
+        buffer = self._buffers[fileno]
+        buffer += chunk
+        if len(buffer) > TM_MAX_OUTPUT:
+            del buffer[: len(buffer) - TM_MAX_OUTPUT]
+        return len(chunk)
+
     def get_io(self) -> t.Tuple[t.Optional[str], t.Optional[str]]:
         """Get the IO from the subprocess
 
+        Output still in the pipes is read without blocking, so processes
+        that outlive the task and hold its pipes open are not waited on.
+        At most TM_MAX_OUTPUT bytes are drained from each pipe, as those
+        processes may keep writing to it.
+
         :return: output and error from the Popen
         """
         # Process class does not implement communicate
         if not self.owned or not isinstance(self.process, psutil.Popen):
             return None, None
 
-        output, error = self.process.communicate()
-        if output:
-            output = output.decode("utf-8")
-        if error:
-            error = error.decode("utf-8")
+        for fileno in list(self._open_pipes):
+            for _ in range(TM_MAX_OUTPUT // TM_READ_SIZE):
+                if not self._read_chunk(fileno):
+                    break
+
+        output, error = (
+            (
+                None
+                if fileno is None
+                else self._buffers[fileno].decode("utf-8", errors="replace")
+            )
+            for fileno in self._io_pipes
+        )
         return output, error
 
     def kill(self, timeout: int = 10) -> None:
@@ -337,8 +500,31 @@ class Task:
             logger.debug("SIGTERM failed, using SIGKILL")
             self.process.kill()
 
-    def wait(self) -> None:
-        self.process.wait()
+    def wait(self, timeout: t.Optional[float] = None) -> t.Optional[int]:
+        """Block until the task exits or the timeout expires
+
+        :param timeout: time to wait in seconds, None to wait indefinitely
+        :return: returncode if finished otherwise None
+        """
+        if self.pidfd is not None:
+            poller = select.poll()
+            poller.register(self.pidfd, select.POLLIN)
+            poller.poll(None if timeout is None else timeout * 1000)
+            return self.check_status()
+        try:
+            self.process.wait(timeout=timeout)
+        except psutil.TimeoutExpired:
+            return None
+        return self.check_status()
+
+    def close(self) -> None:
+        """Release the pidfd and output pipes held for this task"""
+        if self.pidfd is not None:
+            os.close(self.pidfd)
+            self.pidfd = None
+        for stream in self._streams.values():
+            stream.close()
+        self._open_pipes.clear()
 
     @property
     def returncode(self) -> t.Optional[int]:
@@ -363,3 +549,21 @@ class Task:
         if isinstance(self.process, psutil.Popen):
             return True
         return False
+
+
+def _open_pidfd(pid: int) -> t.Optional[int]:
+    """Open a file descriptor that becomes readable when a process exits
+
+    pidfds require Linux 5.3 or newer. On other platforms, or if the
+    process has already exited, None is returned and the task is polled.
+
+    :param pid: id of the process to watch
+    :return: pidfd or None if one could not be opened
+    """
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None:
+        return None
+    try:
+        return int(pidfd_open(pid, 0))
+    except OSError:
+        return None
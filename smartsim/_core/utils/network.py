@@ -26,6 +26,7 @@
 
 import socket
 import typing as t
+from functools import lru_cache
 
 import psutil
 
@@ -34,6 +35,9 @@ A handful of useful functions for dealing with networks
 """
 
 
+LOOPBACK_IP = "127.0.0.1"
+
+
 class IFConfig(t.NamedTuple):
     interface: t.Optional[str]
     address: t.Optional[str]
@@ -49,8 +53,16 @@ def get_ip_from_host(host: str) -> str:
     return ip_address
 
 
-# impossible to cover as it's only used in entrypoints
-def get_ip_from_interface(interface: str) -> str:  # pragma: no cover
+@lru_cache(maxsize=1)
+def _cached_if_addrs() -> t.Dict[str, t.List[t.Any]]:
+    """Enumerate the network interfaces of this node once per process
+
+    :returns: mapping of interface names to their addresses
+    """
+    return psutil.net_if_addrs()
+
+
+def get_ip_from_interface(interface: str) -> str:
     """Get IPV4 address of a network interface
 
     :param interface: interface name
@@ -58,7 +70,7 @@ def get_ip_from_interface(interface: str) -> str:  # pragma: no cover
     :raises ValueError: if interface does not have an IPV4 address
     :return: ip address of interface
     """
-    net_if_addrs = psutil.net_if_addrs()
+    net_if_addrs = _cached_if_addrs()
     if interface not in net_if_addrs:
         available = list(net_if_addrs.keys())
         raise ValueError(
@@ -68,30 +80,28 @@ def get_ip_from_interface(interface: str) -> str:  # pragma: no cover
 
     for info in net_if_addrs[interface]:
         if info.family == socket.AF_INET:
-            return info.address
+            return str(info.address)
     raise ValueError(f"interface {interface} doesn't have an IPv4 address")
 
 
-# impossible to cover as it's only used in entrypoints
-def get_lb_interface_name() -> str:  # pragma: no cover
-    """Use psutil to get loopback interface name"""
-    net_if_addrs = list(psutil.net_if_addrs())
-    for interface in net_if_addrs:
-        if interface.startswith("lo"):
-            return interface
-    raise OSError("Could not find loopback interface name")
+@lru_cache(maxsize=None)
+def current_ip(interface: str = "lo") -> str:
+    """Get the IPV4 address of a network interface of this node
 
+    Addresses are cached as they do not change while an entrypoint runs
 
-def current_ip(interface: str = "lo") -> str:  # pragma: no cover
+    :param interface: interface name, defaults to the loopback interface
+    :return: ip address of interface
+    """
+    # the loopback address is fixed, so don't enumerate interfaces for it
     if interface == "lo":
-        loopback = get_lb_interface_name()
-        return get_ip_from_interface(loopback)
+        return LOOPBACK_IP
 
     return get_ip_from_interface(interface)
 
 
 def get_best_interface_and_address() -> IFConfig:
-    available_ifs = psutil.net_if_addrs()
+    available_ifs = _cached_if_addrs()
     # TODO make this a CONFIG-time parameter
     known_ifs = ["hsn", "ipogif", "ib"]
     for interface in available_ifs:
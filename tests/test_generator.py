@@ -25,6 +25,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import filecmp
+import time
 from os import path as osp
 
 import pytest
@@ -377,3 +378,58 @@ def test_no_file_overwrite():
         ensemble.attach_generator_files(
             to_copy=["/normal/file.txt", "/path/to/smartsim_params.txt"]
         )
+
+
+def test_ensemble_members_generated_concurrently(fileutils, test_dir, monkeypatch):
+    """Members finishing out of order are still configured and logged
+    in member order"""
+    exp = Experiment("gen-concurrent-test", test_dir, launcher="local")
+
+    params = {"THERMO": [10, 20, 30], "STEPS": [40, 50, 60]}
+    ensemble = exp.create_ensemble(
+        "conc", params=params, run_settings=rs, perm_strategy="step"
+    )
+    ensemble.attach_generator_files(to_configure=get_gen_file(fileutils, "in.atm"))
+
+    # make earlier members finish later
+    populate = Generator._populate_entity_dir
+
+    def slow_populate(self, entity):
+        time.sleep(0.1 * (len(ensemble) - int(entity.name.split("_")[-1])))
+        return populate(self, entity)
+
+    monkeypatch.setattr(Generator, "_populate_entity_dir", slow_populate)
+    exp.generate(ensemble)
+
+    for entity in ensemble:
+        with open(osp.join(entity.path, "in.atm")) as f:
+            config = f.read()
+        assert f"thermo          {entity.params['THERMO']}\n" in config
+        assert f"run             {entity.params['STEPS']}\n" in config
+
+        with open(osp.join(entity.path, "smartsim_params.txt")) as f:
+            assert f.readline() == f"Model name: {entity.name}\n"
+
+    with open(osp.join(test_dir, "smartsim_params.txt")) as f:
+        names = [line for line in f if line.startswith("Model name:")]
+    assert names == [f"Model name: {entity.name}\n" for entity in ensemble]
+
+
+def test_ensemble_member_error_raised(fileutils, test_dir):
+    """An error populating one member is raised by the generator"""
+    exp = Experiment("gen-member-error-test", test_dir, launcher="local")
+
+    params = {"THERMO": [10, 20, 30]}
+    ensemble = exp.create_ensemble("err", params=params, run_settings=rs)
+    config = get_gen_file(fileutils, "in.atm")
+    ensemble.attach_generator_files(to_configure=config)
+
+    # copying and linking the same file collides in a single member
+    to_link = get_gen_file(fileutils, "to_symlink_dir/mock2.txt")
+    ensemble.models[1].attach_generator_files(
+        to_configure=config, to_copy=to_link, to_symlink=to_link
+    )
+
+    gen = Generator(test_dir)
+    with pytest.raises(FileExistsError):
+        gen.generate_experiment(ensemble)
@@ -25,6 +25,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import filecmp
+import os
 from distutils import dir_util
 from glob import glob
 from os import path
@@ -163,3 +164,28 @@ def test_write_mw_error_3(fileutils, test_dir):
         writer.configure_tagged_model_files(
             glob(test_dir + "/*"), param_dict, make_missing_tags_fatal=True
         )
+
+
+def test_replace_multiple_tags_per_line():
+    """Tags used and unused by a model may share a line, and values are
+    written verbatim"""
+    writer = ModelWriter()
+    writer.lines = [";a; ;b; ;c;\n", "path = ;d;\n"]
+    used = writer._replace_tags({"a": 1, "c": "3", "d": r"C:\new"})
+
+    assert writer.lines == ["1 b 3\n", "path = C:\\new\n"]
+    assert used == {"a": "1", "c": "3", "d": r"C:\new"}
+
+
+def test_untagged_file_not_rewritten(test_dir):
+    """Files that contain no tags are not written back to disk"""
+    untagged = path.join(test_dir, "untagged.txt")
+    with open(untagged, "w", encoding="utf-8") as f:
+        f.write("nothing to configure\n")
+    mtime = os.stat(untagged).st_mtime_ns
+
+    writer = ModelWriter()
+    files_to_tags = writer.configure_tagged_model_files([untagged], {"5": 10})
+
+    assert files_to_tags == {untagged: {}}
+    assert os.stat(untagged).st_mtime_ns == mtime
@@ -0,0 +1,95 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import subprocess
+import sys
+
+import pytest
+
+from smartsim._core.entrypoints.redis import get_parser
+
+# The tests in this file belong to the group_a group
+pytestmark = pytest.mark.group_a
+
+
+def get_args(*extra):
+    return [
+        "+orc-exe",
+        "redis-server",
+        "+conf-file",
+        "redis.conf",
+        "+rai-module",
+        "--loadmodule",
+        "redisai.so",
+        "+name",
+        "orc_0",
+        "+port",
+        "6780",
+        "+ifname",
+        "lo",
+        *extra,
+    ]
+
+
+def test_parser():
+    args = get_parser().parse_args(get_args())
+
+    assert args.orc_exe == "redis-server"
+    assert args.rai_module == ["--loadmodule", "redisai.so"]
+    assert args.port == 6780
+    assert args.ifname == "lo"
+    assert not args.cluster
+    assert not args.tee
+
+
+def test_parser_tee():
+    args = get_parser().parse_args(get_args("+tee"))
+    assert args.tee
+
+
+def test_parser_missing_required():
+    with pytest.raises(SystemExit):
+        get_parser().parse_args(["+name", "orc_0"])
+
+
+@pytest.mark.parametrize(
+    "extra", [pytest.param((), id="exec"), pytest.param(("+tee",), id="tee")]
+)
+def test_database_output(extra):
+    """The database output follows the summary on the entrypoint's stdout"""
+    args = get_args(*extra)
+    args[1] = "echo"
+    proc = subprocess.run(
+        [sys.executable, "-m", "smartsim._core.entrypoints.redis", *args],
+        capture_output=True,
+        check=False,
+    )
+    output = proc.stdout.decode("utf-8")
+
+    assert proc.returncode == 0
+    assert "COMMAND: echo redis.conf" in output
+    assert output.rstrip().endswith("--bind-source-addr 127.0.0.1")
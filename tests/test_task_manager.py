@@ -0,0 +1,221 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import selectors
+import signal
+import subprocess
+import time
+
+import pytest
+
+from smartsim._core.launcher import taskManager
+from smartsim._core.launcher.taskManager import TaskManager
+
+# The tests in this file belong to the group_b group
+pytestmark = pytest.mark.group_b
+
+requires_pidfd = pytest.mark.skipif(
+    not hasattr(os, "pidfd_open"), reason="pidfd_open is not available"
+)
+
+
+def wait_for_completion(task_manager, task_id, timeout=10):
+    start = time.time()
+    while time.time() - start < timeout:
+        status, returncode, out, err = task_manager.get_task_update(task_id)
+        if returncode is not None:
+            return status, returncode, out, err
+        time.sleep(0.01)
+    pytest.fail(f"Task {task_id} did not complete in {timeout} seconds")
+
+
+def test_task_completes(test_dir):
+    task_manager = TaskManager()
+    task_id = task_manager.start_task(["sleep", "0.5"], test_dir)
+    task_manager.start()
+
+    status, returncode, _, _ = wait_for_completion(task_manager, task_id)
+    assert status == "Completed"
+    assert returncode == 0
+    assert len(task_manager) == 0
+
+
+def test_task_failure_reported(test_dir):
+    task_manager = TaskManager()
+    task_id = task_manager.start_task(["bash", "-c", "sleep 0.5; exit 3"], test_dir)
+    task_manager.start()
+
+    status, returncode, _, _ = wait_for_completion(task_manager, task_id)
+    assert status == "Failed"
+    assert returncode == 3
+
+
+@requires_pidfd
+def test_pidfd_released_on_removal(test_dir):
+    task_manager = TaskManager()
+    task_id = task_manager.start_task(["sleep", "10"], test_dir)
+    task = task_manager[task_id]
+    pidfd = task.pidfd
+    assert pidfd is not None
+
+    task_manager.remove_task(task_id)
+    assert task.pidfd is None
+    assert len(task_manager) == 0
+    with pytest.raises(OSError):
+        os.fstat(pidfd)
+
+
+def test_task_wait(test_dir):
+    task_manager = TaskManager()
+    task_id = task_manager.start_task(["sleep", "1"], test_dir)
+    task = task_manager[task_id]
+
+    assert task.wait(timeout=0.01) is None
+    assert task.wait(timeout=10) == 0
+    task_manager.remove_task(task_id)
+
+
+def test_task_killed_by_signal(test_dir):
+    task_manager = TaskManager()
+    task_id = task_manager.start_task(["sleep", "10"], test_dir)
+    task_manager.start()
+    os.kill(int(task_id), signal.SIGKILL)
+
+    status, returncode, _, _ = wait_for_completion(task_manager, task_id)
+    assert status == "Failed"
+    assert returncode == -signal.SIGKILL
+
+
+def test_task_output_drained(test_dir):
+    """Tasks writing more than a pipe can buffer are not blocked"""
+    task_manager = TaskManager()
+    script = "head -c 1000000 /dev/zero | tr '\\0' a; echo error >&2"
+    task_id = task_manager.start_task(["bash", "-c", script], test_dir)
+    task_manager.start()
+
+    status, returncode, out, err = wait_for_completion(task_manager, task_id)
+    assert status == "Completed"
+    assert returncode == 0
+    assert out == "a" * 1_000_000
+    assert err == "error\n"
+
+
+def test_task_output_capped(test_dir, monkeypatch):
+    """Only the end of the output of a task is kept"""
+    monkeypatch.setattr(taskManager, "TM_MAX_OUTPUT", 1 << 16)
+    task_manager = TaskManager()
+    script = "head -c 1000000 /dev/zero | tr '\\0' a; printf bbbb"
+    task_id = task_manager.start_task(["bash", "-c", script], test_dir)
+    task_manager.start()
+
+    status, returncode, out, _ = wait_for_completion(task_manager, task_id)
+    assert status == "Completed"
+    assert returncode == 0
+    assert out == "a" * ((1 << 16) - 4) + "bbbb"
+
+
+def test_continuous_output_bounded(test_dir, monkeypatch):
+    """A task that never stops writing doesn't grow its buffer unbounded"""
+    monkeypatch.setattr(taskManager, "TM_MAX_OUTPUT", 1 << 16)
+    task_manager = TaskManager()
+    task_id = task_manager.start_task(["yes"], test_dir)
+    task_manager.start()
+    time.sleep(0.5)
+
+    task = task_manager[task_id]
+    stdout = task.pipes[0]
+    with task_manager._lock:
+        assert len(task._buffers[stdout]) <= 1 << 16
+    task.kill()
+
+    status, _, out, _ = wait_for_completion(task_manager, task_id)
+    assert status == "Failed"
+    assert 0 < len(out) <= 1 << 16
+
+
+def test_task_without_captured_io(test_dir):
+    task_manager = TaskManager()
+    task_id = task_manager.start_task(
+        ["echo", "hello"], test_dir, out=subprocess.DEVNULL, err=subprocess.DEVNULL
+    )
+    assert task_manager[task_id].pipes == []
+    task_manager.start()
+
+    status, returncode, out, err = wait_for_completion(task_manager, task_id)
+    assert status == "Completed"
+    assert returncode == 0
+    assert out is None and err is None
+
+
+def test_task_added_after_start(test_dir):
+    """Tasks started some time after the monitor are still monitored"""
+    task_manager = TaskManager()
+    task_manager.start()
+    time.sleep(0.1)
+    task_id = task_manager.start_task(["sleep", "0.3"], test_dir)
+
+    status, returncode, _, _ = wait_for_completion(task_manager, task_id)
+    assert status == "Completed"
+    assert returncode == 0
+    assert len(task_manager) == 0
+
+
+@requires_pidfd
+def test_stale_event_ignored(test_dir, monkeypatch):
+    """Events for a removed task do not affect a task that reuses its fd"""
+    task_manager = TaskManager()
+    stale_id = task_manager.start_task(["sleep", "10"], test_dir)
+    stale = task_manager[stale_id]
+    task_manager.remove_task(stale_id)
+
+    task_id = task_manager.start_task(["sleep", "10"], test_dir)
+    task = task_manager[task_id]
+    stale_key = selectors.SelectorKey(
+        task.pidfd, task.pidfd, selectors.EVENT_READ, stale
+    )
+    monkeypatch.setattr(
+        task_manager._selector,
+        "select",
+        lambda timeout=None: [(stale_key, selectors.EVENT_READ)],
+    )
+
+    assert task_manager._wait_for_tasks(0) == []
+    assert task.pidfd in task_manager._selector.get_map()
+    task_manager.remove_task(task_id)
+
+
+def test_reaped_task_not_watched(test_dir):
+    """Tasks that exited before being added are polled, not watched"""
+    task_manager = TaskManager()
+    task_id = task_manager.start_task(["true"], test_dir)
+    assert task_manager[task_id].pidfd is None
+    task_manager.start()
+
+    status, returncode, _, _ = wait_for_completion(task_manager, task_id)
+    assert status == "Completed"
+    assert returncode == 0
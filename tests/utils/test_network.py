@@ -1,5 +1,9 @@
+import contextlib
+
+import psutil
 import pytest
 
+from smartsim._core.utils import network
 from smartsim._core.utils.network import find_free_port
 
 # The tests in this file belong to the group_a group
@@ -28,3 +32,57 @@ def test_find_free_port_range_specified(start_at):
     starting port number is identified and returned"""
     port = find_free_port(start_at)
     assert port >= start_at
+
+
+def test_interfaces_enumerated_once(monkeypatch):
+    """Test that the network interfaces are only enumerated once when
+    looking up interface addresses"""
+    calls = []
+    net_if_addrs = psutil.net_if_addrs
+    interface = next(iter(net_if_addrs()))
+
+    def mock_net_if_addrs():
+        calls.append(1)
+        return net_if_addrs()
+
+    monkeypatch.setattr(psutil, "net_if_addrs", mock_net_if_addrs)
+    network._cached_if_addrs.cache_clear()
+    try:
+        for _ in range(2):
+            with contextlib.suppress(ValueError):
+                network.get_ip_from_interface(interface)
+        network.get_best_interface_and_address()
+    finally:
+        network._cached_if_addrs.cache_clear()
+
+    assert len(calls) == 1
+
+
+def test_loopback_ip(monkeypatch):
+    """Test that the loopback address is returned without enumerating
+    the network interfaces"""
+    monkeypatch.setattr(network, "_cached_if_addrs", None)
+    network.current_ip.cache_clear()
+    try:
+        assert network.current_ip("lo") == "127.0.0.1"
+    finally:
+        network.current_ip.cache_clear()
+
+
+def test_current_ip_cached(monkeypatch):
+    """Test that the address of an interface is only looked up once"""
+    calls = []
+
+    def mock_get_ip_from_interface(interface):
+        calls.append(interface)
+        return "10.0.0.1"
+
+    monkeypatch.setattr(network, "get_ip_from_interface", mock_get_ip_from_interface)
+    network.current_ip.cache_clear()
+    try:
+        assert network.current_ip("ib0") == "10.0.0.1"
+        assert network.current_ip("ib0") == "10.0.0.1"
+    finally:
+        network.current_ip.cache_clear()
+
+    assert calls == ["ib0"]